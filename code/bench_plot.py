@@ -0,0 +1,93 @@
+"""
+Benchmark Plot frame time against buf_size.
+
+Feeds synthetic ECG batches (~1 frame of samples at fs) into the sweep
+Plot and compares with a full-window setData redraw of the same curves.
+"push" times the data update only, "frame" adds the repaint.
+Run: python code/bench_plot.py  (set QT_QPA_PLATFORM=offscreen if headless)
+"""
+import sys
+import time
+import queue
+import numpy as np
+import pyqtgraph as pg
+from PySide6.QtWidgets import QApplication
+from config import Config
+from plot import Plot
+
+SIZES = (1000, 2000, 5000, 10000, 20000)
+FRAMES = 300
+
+def _synth(n, fs, start):
+    """Spiky ECG-like batch with one R-peak flag per second."""
+    t = start + np.arange(n)
+    sig = 250.0 * np.exp(-((t % fs) - fs // 2) ** 2 / 20.0)
+    mwi = 5000.0 * np.exp(-((t % fs) - fs // 2 - 20) ** 2 / 400.0)
+    peak = ((t % fs) == fs // 2 + 25).astype(np.float64)
+    th = np.full(n, 2000.0)
+    return sig, mwi, peak, th, 72
+
+def _bench_sweep(app, cfg, per_frame):
+    q = queue.Queue()
+    plot = Plot(cfg, q)
+    plot.timer.stop()
+    plot.show()
+
+    def step(k):
+        q.put(_synth(per_frame, cfg.fs, k * per_frame))
+        t0 = time.perf_counter()
+        plot.update()
+        t1 = time.perf_counter()
+        app.processEvents()
+        t2 = time.perf_counter()
+        return np.array([t1 - t0, t2 - t0])
+
+    # Warm up with one full sweep so every segment holds data
+    frames = cfg.buf_size // per_frame + 1
+    for k in range(frames): step(k)
+
+    elps = sum(step(k) for k in range(frames, frames + FRAMES)) / FRAMES
+    plot.close()
+    return elps
+
+def _bench_full(app, cfg, per_frame):
+    """Previous behaviour: push the whole window of every curve each frame."""
+    win = pg.GraphicsLayoutWidget()
+    win.resize(1000, 700)
+    p1 = win.addPlot(row=0, col=0)
+    p2 = win.addPlot(row=1, col=0)
+    for p, y_max in ((p1, 300), (p2, 10000)):
+        p.showGrid(x=True, y=True, alpha=0.3)
+        p.setRange(xRange=(0, cfg.buf_size / cfg.fs), yRange=(0, y_max), padding=0)
+        p.disableAutoRange()
+    curves = [p1.plot(), p2.plot(), p2.plot()]
+    win.show()
+    x = np.arange(cfg.buf_size) / cfg.fs
+    ys = [np.zeros(cfg.buf_size, dtype=np.float32) for _ in curves]
+
+    elps = np.zeros(2)
+    for k in range(FRAMES):
+        data = _synth(per_frame, cfg.fs, k * per_frame)
+        t0 = time.perf_counter()
+        for y, c, d in zip(ys, curves, (data[0], data[1], data[3])):
+            y[:] = np.roll(y, -per_frame)
+            y[-per_frame:] = d
+            c.setData(x, y)
+        t1 = time.perf_counter()
+        app.processEvents()
+        elps += (t1 - t0, time.perf_counter() - t0)
+    elps /= FRAMES
+    win.close()
+    return elps
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    per_frame = int(Config.fs * 0.033) + 1
+
+    print(f"{'buf_size':<10} | {'sweep push/frame (ms)':<22} | {'full push/frame (ms)':<22}")
+    print("-" * 62)
+    for size in SIZES:
+        cfg = Config(buf_size=size)
+        sp, sf = _bench_sweep(app, cfg, per_frame) * 1000
+        fp, ff = _bench_full(app, cfg, per_frame) * 1000
+        print(f"{size:<10} | {f'{sp:.3f} / {sf:.3f}':<22} | {f'{fp:.3f} / {ff:.3f}':<22}")
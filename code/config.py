@@ -35,4 +35,8 @@ class Config:
     min_th: int = 1000    # Minimum Threshold
 
     # Plot Data buffer
-    buf_size: int = 2000
\ No newline at end of file
+    buf_size: int = 2000
+
+    # Sweep display
+    sweep_seg: int = 100  # Samples per curve segment (redrawn unit)
+    sweep_gap: int = 50   # Erase bar width ahead of the cursor (samples)
\ No newline at end of file
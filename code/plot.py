@@ -2,13 +2,12 @@
 PyQtGraph-based real-time visualization for ECG Monitor.
 """
 import queue
-import numpy as np
 import pyqtgraph as pg
 from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget
 from PySide6.QtGui import QFont
 from config import Config
-from ring_buffer import RingBuf
+from sweep import SweepCurve, SweepPeaks
 
 class Plot(QMainWindow):
     def __init__(self, cfg: Config, input: queue.Queue):
@@ -41,7 +40,10 @@ class Plot(QMainWindow):
         self.p1.setYRange(-200, 300, padding=0)
         self.p1.enableAutoRange(axis='y', enable=False)
         
-        self.ecg = self.p1.plot(pen=pg.mkPen("#00FFFF", width=1.5), name="ECG")
+        self.ecg = SweepCurve(
+            self.p1, cfg.buf_size, cfg.fs, pg.mkPen("#00FFFF", width=1.5),
+            seg_len=cfg.sweep_seg, gap=cfg.sweep_gap,
+        )
         
         self.peak = pg.ScatterPlotItem(
             size=10,
@@ -49,6 +51,11 @@ class Plot(QMainWindow):
             brush=pg.mkBrush(255, 0, 0, 255),  # Red
         )
         self.p1.addItem(self.peak)
+        self.peaks = SweepPeaks(self.peak, self.ecg)
+        
+        # Sweep cursor
+        self.cursor = pg.InfiniteLine(pos=0, angle=90, pen=pg.mkPen("#FFFFFF", width=1))
+        self.p1.addItem(self.cursor)
 
         # BPM Text
         self.bpm_text = pg.TextItem(
@@ -73,16 +80,15 @@ class Plot(QMainWindow):
         self.p2.setYRange(0, 10000, padding=0)
         self.p2.enableAutoRange(axis='y', enable=False)
         
-        self.mwi = self.p2.plot(pen=pg.mkPen("#00FF00", width=1.5), name="MWI")
-        self.th = self.p2.plot(
-            pen=pg.mkPen("#FFFF00", style=pg.QtCore.Qt.DashLine), name="Th"
+        self.mwi = SweepCurve(
+            self.p2, cfg.buf_size, cfg.fs, pg.mkPen("#00FF00", width=1.5),
+            seg_len=cfg.sweep_seg, gap=cfg.sweep_gap,
+        )
+        self.th = SweepCurve(
+            self.p2, cfg.buf_size, cfg.fs,
+            pg.mkPen("#FFFF00", style=pg.QtCore.Qt.DashLine),
+            seg_len=cfg.sweep_seg, gap=cfg.sweep_gap,
         )
-        
-        # Ring buffers
-        self.buf_ecg = RingBuf(cfg.buf_size)
-        self.buf_mwi = RingBuf(cfg.buf_size)
-        self.buf_th = RingBuf(cfg.buf_size)
-        self.buf_peak = RingBuf(cfg.buf_size, dtype=np.float32)
         
         # Timer (30fps)
         self.timer = QTimer()
@@ -98,10 +104,10 @@ class Plot(QMainWindow):
                 if not data: continue
                 
                 sig, mwi, peak, th, bpm = data
-                self.buf_ecg.extend(sig)
-                self.buf_mwi.extend(mwi)
-                self.buf_peak.extend(peak)
-                self.buf_th.extend(th)
+                pos = self.ecg.extend(sig)
+                self.mwi.extend(mwi)
+                self.th.extend(th)
+                self.peaks.extend(peak, pos)
                 
                 # BPM Update
                 if bpm > 0: self.bpm_text.setText(f"{bpm} BPM")
@@ -114,40 +120,12 @@ class Plot(QMainWindow):
                 break
                 
         if processed > 0:
-            y_ecg = self.buf_ecg.get_view()
-            y_mwi = self.buf_mwi.get_view()
-            y_th = self.buf_th.get_view()
-            y_peak = self.buf_peak.get_view()
-            
-            x_axis = np.arange(len(y_ecg)) / self.cfg.fs
-            
-            self.ecg.setData(x_axis, y_ecg)
-            self.mwi.setData(x_axis, y_mwi)
-            self.th.setData(x_axis, y_th)
-            
-            # Peak Markers
-            raw_peak = np.flatnonzero(y_peak)
-            true_idx = []            
-            win = 40 
-            
-            for idx in raw_peak:
-                start = max(0, idx - win)
-                end = idx + 5
-                if end > start:
-                    local_max = np.argmax(y_ecg[start : end])
-                    real_peak = start + local_max
-                    true_idx.append(real_peak)
-                else:
-                    true_idx.append(idx)
-
-            if len(true_idx) > 0:
-                true_idx = np.array(true_idx, dtype=int)
-                pk_time = x_axis[true_idx]
-                pk_val = y_ecg[true_idx]
-                
-                self.peak.setData(pk_time, pk_val)
-            else:
-                self.peak.clear()
+            # Only segments touched by new samples / erase bar are redrawn
+            self.ecg.flush()
+            self.mwi.flush()
+            self.th.flush()
+            self.peaks.flush()
+            self.cursor.setPos(self.ecg.ptr / self.cfg.fs)
 
             view = self.p1.viewRange()
             x_min, x_max = view[0]
@@ -0,0 +1,134 @@
+"""
+Sweep-mode traces for hospital-monitor style rendering.
+
+The trace is drawn in place over a fixed time axis: a write cursor
+sweeps left to right and wraps, and an erase bar (gap of blank samples)
+runs ahead of it. Each curve is split into fixed segments so a frame
+only pushes the segments touched by new samples, not the whole window.
+"""
+import numpy as np
+import pyqtgraph as pg
+from ring_buffer import RingBuf
+
+class SweepCurve:
+    __slots__ = ('buf', 'x', 'seg_len', 'gap', 'segs', 'dirty')
+
+    def __init__(self, plot, size, fs, pen, seg_len=100, gap=50):
+        # Ring storage is the screen order, no need to unroll it
+        self.buf = RingBuf(size)
+        self.buf.data[:] = np.nan
+        self.x = np.arange(size) / fs
+        self.seg_len = seg_len
+        self.gap = min(gap, size - 1)
+
+        n_segs = -(-size // seg_len)
+        # Bare PlotCurveItem, PlotDataItem.setData overhead dominates small segments
+        self.segs = [pg.PlotCurveItem(pen=pen, connect='finite') for _ in range(n_segs)]
+        for seg in self.segs: plot.addItem(seg)
+        self.dirty = np.zeros(n_segs, dtype=bool)
+
+    @property
+    def ptr(self):
+        return self.buf.ptr
+
+    @property
+    def data(self):
+        return self.buf.data
+
+    def extend(self, vals):
+        """
+        Write new samples at the cursor and blank the erase bar ahead of it.
+        Returns the buffer positions of the samples kept (at most `size`).
+        """
+        n = len(vals)
+        size = self.buf.size
+        if n == 0: return np.empty(0, dtype=np.intp)
+
+        start = self.buf.ptr
+        self.buf.extend(vals)
+        if n >= size:
+            self.buf.data[:self.gap] = np.nan
+            self.dirty[:] = True
+            return np.arange(size)
+
+        pos = (start + np.arange(n)) % size
+        erase = (self.buf.ptr + np.arange(self.gap)) % size
+        self.buf.data[erase] = np.nan
+        self._mark(pos)
+        self._mark(erase)
+        return pos
+
+    def _mark(self, idx):
+        seg = idx // self.seg_len
+        self.dirty[seg] = True
+        # First sample of a segment is also the last point of the previous one
+        head = seg[(idx % self.seg_len == 0) & (idx > 0)]
+        self.dirty[head - 1] = True
+
+    def flush(self):
+        """Push only the dirty segments to the plot."""
+        L = self.seg_len
+        for k in np.flatnonzero(self.dirty):
+            sl = slice(k * L, (k + 1) * L + 1)
+            self.segs[k].setData(self.x[sl], self.buf.data[sl])
+        self.dirty[:] = False
+
+
+class SweepPeaks:
+    __slots__ = ('scatter', 'curve', 'win', 'lead', 'pending', 'pos', 'val', 'removed')
+
+    def __init__(self, scatter: pg.ScatterPlotItem, curve: SweepCurve, win=40, lead=5):
+        self.scatter = scatter
+        self.curve = curve
+        self.win = win    # Look-back window for the local R-peak max
+        self.lead = lead  # Samples needed past the detection flag
+        self.pending = []
+        self.pos = np.empty(0, dtype=np.intp)
+        self.val = np.empty(0, dtype=np.float32)
+        self.removed = False
+
+    def extend(self, flags, pos):
+        """Queue detections of one batch and expire markers the cursor overwrote."""
+        if len(pos) == 0: return
+        size = self.curve.buf.size
+
+        # Swept region of this batch: new samples + erase bar
+        swept = len(pos) + self.curve.gap
+        if len(self.pos):
+            stale = (self.pos - pos[0]) % size < swept
+            if stale.any():
+                self.pos = self.pos[~stale]
+                self.val = self.val[~stale]
+                self.removed = True
+        flags = flags[-len(pos):]
+        self.pending.extend(pos[np.flatnonzero(flags)].tolist())
+
+    def flush(self):
+        """Resolve pending peaks and update the scatter incrementally."""
+        size = self.curve.buf.size
+        ptr = self.curve.ptr
+        data = self.curve.data
+
+        added, waiting = [], []
+        for p in self.pending:
+            if (ptr - p) % size < self.lead:
+                waiting.append(p)
+                continue
+            # Refine to the local max of the ECG around the MWI detection
+            idx = (p + np.arange(-self.win, self.lead)) % size
+            seg = data[idx]
+            if np.isnan(seg).all(): continue
+            real = idx[np.nanargmax(seg)]
+            added.append((real, data[real]))
+        self.pending = waiting
+
+        if added:
+            new_pos, new_val = zip(*added)
+            self.pos = np.concatenate((self.pos, new_pos)).astype(np.intp)
+            self.val = np.concatenate((self.val, new_val)).astype(np.float32)
+
+        if self.removed:
+            self.scatter.setData(self.curve.x[self.pos], self.val)
+        elif added:
+            self.scatter.addPoints(self.curve.x[list(new_pos)], new_val)
+        self.removed = False